@@ -1,12 +1,22 @@
+import asyncio
+import threading
+from dataclasses import dataclass
 from datetime import date
 from pathlib import Path
-import csv
 
-from fastapi import FastAPI, Query
+import numpy as np
+import orjson
+import pandas as pd
+import pyarrow as pa
+from fastapi import FastAPI, Query, Response
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, Field
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
 from typing import List, Optional, Dict
 
+from scoring import score_rows
+
 # ------------------------
 # FastAPI app setup
 # ------------------------
@@ -14,6 +24,8 @@ from typing import List, Optional, Dict
 app = FastAPI(
     title="Customer Insights API",
     version="1.0.0",
+    # orjson serializes responses in C, well faster than json.dumps
+    default_response_class=ORJSONResponse,
 )
 
 # Allow the Angular frontend (localhost:4200) to talk to this backend
@@ -31,30 +43,37 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress large bodies (e.g. the full /records/raw dump) for clients
+# that advertise gzip support; small responses are left alone
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 # ------------------------
 # Data models session
 # ------------------------
 
 
-class AccountRecord(BaseModel):
+@dataclass(slots=True)
+class AccountRecord:
     """
     Represents one validated row from sample_data.csv.
-    This mirrors the raw dataset but enforces types and constraints.
+    The constraints are enforced in bulk when the CSV is parsed, so
+    this is a lightweight slotted carrier rather than a Pydantic model.
     """
     account_uuid: str
     account_label: str
     subscription_status: str
-    admin_seats: int = Field(ge=0)
-    user_seats: int = Field(ge=0)
-    read_only_seats: int = Field(ge=0)
-    total_records: int = Field(ge=0)
-    automation_count: int = Field(ge=0)
-    workflow_title: Optional[str] = None
-    messages_processed: int = Field(ge=0)
-    notifications_sent: int = Field(ge=0)
-    notifications_billed: int = Field(ge=0)
-
-
+    admin_seats: int
+    user_seats: int
+    read_only_seats: int
+    total_records: int
+    automation_count: int
+    workflow_title: Optional[str]
+    messages_processed: int
+    notifications_sent: int
+    notifications_billed: int
+
+
+@dataclass(slots=True)
 class AccountInsights(AccountRecord):
     """
     Enriched account record containing derived metrics
@@ -84,11 +103,12 @@ class SummaryResponse(BaseModel):
     churned_accounts: int
 
 
-class PaginatedRecordsResponse(BaseModel):
+@dataclass(slots=True)
+class PaginatedRecordsResponse:
     """
     Wrapper for paginated account records.
     """
-    items: List[AccountInsights]
+    items: List[dict]  # rows shaped like AccountInsights
     page: int
     page_size: int
     total_items: int
@@ -120,15 +140,92 @@ class NotificationsOverTimeItem(BaseModel):
 
 
 # In-memory storage
-# Raw validated records from CSV
-raw_records: List[AccountRecord] = []
-
-# Enriched insights derived from raw records
-insights: List[AccountInsights] = []
-
 # Rows that failed validation
 invalid_rows: List[dict] = []
 
+# Column-oriented (structure-of-arrays) store built at load time.
+# Scoring runs as vectorized NumPy kernels over these contiguous arrays
+# instead of a per-row Python branch cascade.
+columns: Dict[str, np.ndarray] = {}
+
+# Aggregates precomputed once per load; the data is immutable between
+# reloads, so the analytics endpoints answer from these instead of
+# rescanning the records on every request. Values are validated through
+# the response models once at build time, then stored as plain dicts so
+# serving them skips Pydantic re-validation entirely.
+summary_cache: Optional[dict] = None
+health_by_status_cache: List[dict] = []
+revenue_by_status_cache: List[dict] = []
+
+# Per-date notification totals as parallel sorted arrays, so a date
+# range becomes two searchsorted calls plus a slice
+notification_dates: np.ndarray = np.array([], dtype="datetime64[D]")
+notification_totals: np.ndarray = np.array([], dtype=np.int64)
+notification_dates_py: List[date] = []  # same dates as Python objects
+
+# Row indexes built at load time so /records filters intersect small
+# candidate sets instead of re-filtering the full list per request
+status_index: Dict[str, np.ndarray] = {}
+health_sorted_idx: np.ndarray = np.array([], dtype=np.int64)
+
+# Lowercased account labels, computed once per load so the /records
+# search does not call .lower() on every label per request
+label_lower: np.ndarray = np.array([], dtype=object)
+
+# Trigram index over the lowercased labels: each 3-gram maps to the
+# sorted row indices whose label contains it, so substring search only
+# has to verify a small candidate set
+trigram_index: Dict[str, np.ndarray] = {}
+
+# The insight columns materialized once per load as an Arrow table;
+# /records pages are take() slices of it, with no per-row Python
+# object construction in between
+insight_table: Optional[pa.Table] = None
+
+# Prebuilt JSON bodies for the full-dump endpoints, encoded once per
+# load so serving them is a straight bytes copy
+raw_records_json: bytes = b"[]"
+invalid_rows_json: bytes = b"[]"
+
+# The CSV is loaded in a background thread at startup so the server
+# accepts connections immediately; data endpoints wait on this event
+load_thread: Optional[threading.Thread] = None
+data_loaded = threading.Event()
+
+# churn_code -> churn_risk label (index into this tuple)
+CHURN_LABELS = ("healthy", "at_risk", "churned")
+
+# CSV header -> model field name, in AccountRecord field order
+CSV_COLUMNS = {
+    "Account UUID": "account_uuid",
+    "Account Label": "account_label",
+    "Subscription Status": "subscription_status",
+    "Admin Seats": "admin_seats",
+    "User Seats": "user_seats",
+    "Read Only Seats": "read_only_seats",
+    "Total Records": "total_records",
+    "Automation Count": "automation_count",
+    "Workflow Title": "workflow_title",
+    "Messages Processed": "messages_processed",
+    "Notifications Sent": "notifications_sent",
+    "Notifications Billed": "notifications_billed",
+}
+
+# Numeric fields that must parse as non-negative integers
+INT_FIELDS = (
+    "admin_seats",
+    "user_seats",
+    "read_only_seats",
+    "total_records",
+    "automation_count",
+    "messages_processed",
+    "notifications_sent",
+    "notifications_billed",
+)
+
+# Raw CSV-backed fields, matching AccountRecord
+RECORD_FIELDS = tuple(CSV_COLUMNS.values())
+
 # Path to the CSV file
 DATA_FILE_PATH = Path(__file__).resolve().parent.parent / "sample_data.csv"
 
@@ -136,79 +233,269 @@ DATA_FILE_PATH = Path(__file__).resolve().parent.parent / "sample_data.csv"
 # ------------------------
 # Helper functions
 # ------------------------
-def compute_insights(record: AccountRecord, report_date: date) -> AccountInsights:
+def empty_record_frame() -> pd.DataFrame:
+    """An empty DataFrame with the validated-record columns."""
+    return pd.DataFrame({name: [] for name in RECORD_FIELDS})
+
+
+def build_columns(frame: pd.DataFrame, report_dates: List[date]) -> None:
+    """
+    Pack the validated rows into typed NumPy columns. String columns
+    keep object dtype so the optional workflow_title can hold None;
+    numeric columns become contiguous int64 arrays.
+    """
+    columns.clear()
+    for name in (
+        "account_uuid",
+        "account_label",
+        "subscription_status",
+        "workflow_title",
+    ):
+        columns[name] = frame[name].to_numpy(dtype=object)
+    for name in INT_FIELDS:
+        columns[name] = frame[name].to_numpy(dtype=np.int64)
+    columns["report_date"] = np.array(report_dates, dtype="datetime64[D]")
+
+    # Keep the store sorted by report_date (stable, so CSV order breaks
+    # ties); date-range queries can then binary-search contiguous runs
+    order = np.argsort(columns["report_date"], kind="stable")
+    for name, arr in columns.items():
+        columns[name] = arr[order]
+
+
+def compute_derived_columns() -> None:
     """
-    Derive business metrics, health score, and churn risk
-    from a raw AccountRecord.
+    Derive business metrics, health score, and churn risk for all
+    records at once with vectorized kernels.
     """
+    msgs = columns["messages_processed"]
+    sent = columns["notifications_sent"]
+    billed = columns["notifications_billed"]
+
     # Derived metrics # Seat footprint and utilisation
-    total_seats = record.admin_seats + record.user_seats + record.read_only_seats
-    seat_utilisation = (
-        record.messages_processed / total_seats if total_seats > 0 else 0.0
+    total_seats = (
+        columns["admin_seats"] + columns["user_seats"] + columns["read_only_seats"]
     )
-    billing_utilisation = (
-        (record.notifications_billed / record.notifications_sent) * 100.0
-        if record.notifications_sent > 0
-        else 0.0
+    seat_utilisation = np.divide(
+        msgs,
+        total_seats,
+        out=np.zeros(len(msgs), dtype=np.float64),
+        where=total_seats > 0,
+    )
+    billing_utilisation = np.divide(
+        billed * 100.0,
+        sent,
+        out=np.zeros(len(msgs), dtype=np.float64),
+        where=sent > 0,
     )
 
-    # Usage score 0–40
-    if record.messages_processed < 100_000:
-        usage_score = 10
-    elif record.messages_processed < 1_000_000:
-        usage_score = 25
-    else:
-        usage_score = 40
+    inactive = columns["subscription_status"] == "inactive"
+    health_score, churn_code = score_rows(
+        msgs,
+        columns["automation_count"],
+        columns["total_records"],
+        billing_utilisation,
+        np.ascontiguousarray(inactive, dtype=np.bool_),
+    )
 
-    # Automation score 0–20
-    if record.automation_count == 0:
-        automation_score = 0
-    elif record.automation_count <= 3:
-        automation_score = 10
-    else:
-        automation_score = 20
+    columns["total_seats"] = total_seats
+    columns["seat_utilisation"] = np.round(seat_utilisation, 2)
+    columns["billing_utilisation"] = np.round(billing_utilisation, 2)
+    columns["health_score"] = health_score
+    columns["churn_code"] = churn_code
+    columns["churn_risk"] = np.array(CHURN_LABELS, dtype=object)[churn_code]
+
+
+# Column order matching the AccountInsights fields
+INSIGHT_FIELDS = RECORD_FIELDS + (
+    "total_seats",
+    "seat_utilisation",
+    "billing_utilisation",
+    "health_score",
+    "churn_risk",
+    "report_date",
+)
 
-    # Footprint score 0–20
-    if record.total_records < 10_000:
-        footprint_score = 5
-    elif record.total_records < 50_000:
-        footprint_score = 15
-    else:
-        footprint_score = 20
 
-    # Billing score 0–20
-    if billing_utilisation == 0:
-        billing_score = 0
-    elif billing_utilisation <= 90:
-        billing_score = 10
-    else:
-        billing_score = 20
+def build_insight_table() -> None:
+    """
+    Materialize the insight columns as a single Arrow table. The NumPy
+    numeric columns transfer without copying row by row, report_date
+    becomes date32, and the object-dtype string columns become Arrow
+    strings (the one conversion Arrow has to do element-wise).
+    """
+    global insight_table
+
+    arrays = {}
+    for name in INSIGHT_FIELDS:
+        col = columns[name]
+        if col.dtype == object:
+            arrays[name] = pa.array(col.tolist(), type=pa.string())
+        else:
+            arrays[name] = pa.array(col)
+    insight_table = pa.table(arrays)
+
+
+def materialize_page(idx: np.ndarray) -> List[dict]:
+    """
+    Slice the requested rows (shaped like AccountInsights) out of the
+    Arrow table: take() gathers only the page rows from the shared
+    column buffers, and to_pylist hands back dicts ready for the JSON
+    encoder.
+    """
+    return insight_table.take(idx).to_pylist()
 
-    health_score = int(
-        usage_score + automation_score + footprint_score + billing_score
-    )  # 0–100
 
-    # If subscription inactive, health is 0
-    if record.subscription_status == "inactive":
-        health_score = 0
+def build_record_indexes() -> None:
+    """
+    Build the filter indexes for /records: row indices per subscription
+    status, an argsort over health_score so min_health filters reduce
+    to a searchsorted slice, and the lowercased labels for search.
+    """
+    global health_sorted_idx, label_lower
+
+    status = columns["subscription_status"]
+    status_index.clear()
+    for value in np.unique(status):
+        status_index[value] = np.nonzero(status == value)[0]
+
+    health_sorted_idx = np.argsort(columns["health_score"], kind="stable")
+
+    label_lower = np.array(
+        [label.lower() for label in columns["account_label"]], dtype=object
+    )
+
+    postings: Dict[str, set] = {}
+    for i, label in enumerate(label_lower):
+        for j in range(len(label) - 2):
+            postings.setdefault(label[j:j + 3], set()).add(i)
+    trigram_index.clear()
+    trigram_index.update(
+        (gram, np.fromiter(sorted(rows), dtype=np.int64))
+        for gram, rows in postings.items()
+    )
+
 
-    # Churn risk bucket
-    if record.subscription_status == "inactive":
-        churn_risk = "churned"
-    elif health_score < 40:
-        churn_risk = "at_risk"
+def search_label_rows(term: str) -> np.ndarray:
+    """
+    Row indices whose lowercased label contains the (lowercased) term.
+    Terms of three or more characters are narrowed through the trigram
+    postings first; the final substring check remains because matching
+    trigrams need not be contiguous in the label.
+    """
+    if len(term) >= 3:
+        candidates: Optional[np.ndarray] = None
+        for j in range(len(term) - 2):
+            posting = trigram_index.get(term[j:j + 3])
+            if posting is None:
+                return np.array([], dtype=np.int64)
+            candidates = (
+                posting
+                if candidates is None
+                else np.intersect1d(candidates, posting, assume_unique=True)
+            )
     else:
-        churn_risk = "healthy"
-
-    return AccountInsights(
-        **record.dict(),
-        total_seats=total_seats,
-        seat_utilisation=round(seat_utilisation, 2),
-        billing_utilisation=round(billing_utilisation, 2),
-        health_score=health_score,
-        churn_risk=churn_risk,
-        report_date=report_date,
+        # Too short for a trigram; scan all labels
+        candidates = np.arange(label_lower.size, dtype=np.int64)
+
+    return np.array(
+        [i for i in candidates if term in label_lower[i]], dtype=np.int64
+    )
+
+
+def build_aggregate_caches() -> None:
+    """
+    Precompute the /summary and analytics aggregates from the loaded
+    records. Runs once at the end of load_data_from_csv (and again on
+    any reload), so the endpoints answer from the caches instead of
+    rescanning the records per request.
+    """
+    global summary_cache, notification_dates, notification_totals
+
+    # Single C-loop reductions over the column store instead of seven
+    # separate traversals of the record list
+    status = columns["subscription_status"]
+    churn_code = columns["churn_code"]
+
+    total_accounts = int(status.size)
+    active_accounts = int((status == "active").sum())
+    inactive_accounts = int((status == "inactive").sum())
+
+    total_notifications_billed = int(columns["notifications_billed"].sum())
+    total_messages_processed = int(columns["messages_processed"].sum())
+    avg_notifications_billed_per_active = (
+        total_notifications_billed / active_accounts if active_accounts > 0 else 0.0
+    )
+    avg_messages_per_account = (
+        total_messages_processed / total_accounts if total_accounts > 0 else 0.0
+    )
+    avg_health_score = (
+        int(columns["health_score"].sum()) / total_accounts
+        if total_accounts > 0
+        else 0.0
+    )
+
+    at_risk_accounts = int((churn_code == 1).sum())
+    churned_accounts = int((churn_code == 2).sum())
+
+    summary_cache = SummaryResponse(
+        total_accounts=total_accounts,
+        active_accounts=active_accounts,
+        inactive_accounts=inactive_accounts,
+        total_notifications_billed=total_notifications_billed,
+        avg_notifications_billed_per_active=round(
+            avg_notifications_billed_per_active, 2
+        ),
+        total_messages_processed=total_messages_processed,
+        avg_messages_per_account=round(avg_messages_per_account, 2),
+        avg_health_score=round(avg_health_score, 2),
+        at_risk_accounts=at_risk_accounts,
+        churned_accounts=churned_accounts,
+    ).model_dump()
+
+    # Churn codes are 0/1/2, so grouping is a fixed three-slot bincount
+    # rather than dict-keyed accumulation
+    buckets = np.bincount(churn_code, minlength=len(CHURN_LABELS))
+    totals = np.bincount(
+        churn_code,
+        weights=columns["notifications_billed"],
+        minlength=len(CHURN_LABELS),
+    ).astype(np.int64)
+
+    health_by_status_cache[:] = [
+        HealthByStatusItem(status=label, account_count=count).model_dump()
+        for label, count in zip(CHURN_LABELS, buckets.tolist())
+    ]
+    revenue_by_status_cache[:] = [
+        RevenueByStatusItem(
+            status=label, total_notifications_billed=total
+        ).model_dump()
+        for label, total in zip(CHURN_LABELS, totals.tolist())
+    ]
+
+    # Group notification totals by report_date in two C passes
+    notification_dates, inverse = np.unique(
+        columns["report_date"], return_inverse=True
+    )
+    notification_totals = np.bincount(
+        inverse, weights=columns["notifications_billed"]
+    ).astype(np.int64)
+    notification_dates_py[:] = notification_dates.tolist()
+
+
+def build_response_caches() -> None:
+    """
+    Pre-encode the /records/raw and /records/invalid bodies. Both dump
+    the full dataset with no parameters, so the JSON bytes can be built
+    once per load and served as-is.
+    """
+    global raw_records_json, invalid_rows_json
+
+    lists = [columns[name].tolist() for name in RECORD_FIELDS]
+    raw_records_json = orjson.dumps(
+        [dict(zip(RECORD_FIELDS, values)) for values in zip(*lists)]
     )
+    invalid_rows_json = orjson.dumps(invalid_rows)
 
 
 def load_data_from_csv() -> None:
@@ -216,86 +503,165 @@ def load_data_from_csv() -> None:
     Load and validate sample_data.csv into memory.
     Invalid rows are captured separately for transparency.
     """
-    raw_records.clear()
-    insights.clear()
     invalid_rows.clear()
 
+    valid = empty_record_frame()
+    report_dates: List[date] = []
+
     if not DATA_FILE_PATH.exists():
         print(f"[WARN] CSV file not found at: {DATA_FILE_PATH}")
-        return
-
-    print(f"[INFO] Loading data from: {DATA_FILE_PATH}")
-
-    with DATA_FILE_PATH.open(newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row_number, row in enumerate(reader, start=2):  # header is row 1
-            try:
-                # Map CSV headers to model fields
-                mapped = {
-                    "account_uuid": row["Account UUID"],
-                    "account_label": row["Account Label"],
-                    "subscription_status": row["Subscription Status"].strip().lower(),
-                    "admin_seats": row["Admin Seats"],
-                    "user_seats": row["User Seats"],
-                    "read_only_seats": row["Read Only Seats"],
-                    "total_records": row["Total Records"],
-                    "automation_count": row["Automation Count"],
-                    "workflow_title": row.get("Workflow Title") or None,
-                    "messages_processed": row["Messages Processed"],
-                    "notifications_sent": row["Notifications Sent"],
-                    "notifications_billed": row["Notifications Billed"],
-                }
-
-                record = AccountRecord(**mapped)
-
-                # Business validation: billed cannot exceed sent
-                if record.notifications_billed > record.notifications_sent:
-                    raise ValueError(
-                        "Notifications billed cannot exceed notifications sent"
-                    )
-
-                raw_records.append(record)
-
-                # Synthetic report date: cycle through 1–10 Jan 2025
-                day = ((row_number - 2) % 10) + 1  # rows start at 2
-                report_date = date(2025, 1, day)
-
-                insights.append(compute_insights(record, report_date))
-
-            except Exception as e:
-                invalid_rows.append(
-                    {"row_number": row_number, "raw_row": row, "error": str(e)}
-                )
+    else:
+        print(f"[INFO] Loading data from: {DATA_FILE_PATH}")
+        valid, report_dates = parse_csv(DATA_FILE_PATH)
+
+    # Score everything in bulk over the column store; AccountInsights
+    # objects are only materialized per page at request time.
+    build_columns(valid, report_dates)
+    compute_derived_columns()
+    build_insight_table()
+    build_record_indexes()
+    build_aggregate_caches()
+    build_response_caches()
 
     print(
-        f"[INFO] Loaded {len(raw_records)} valid records, "
+        f"[INFO] Loaded {len(valid)} valid records, "
         f"{len(invalid_rows)} invalid rows"
     )
 
 
+def parse_csv(path: Path) -> tuple:
+    """
+    Parse and validate the CSV with pandas in whole-column operations.
+    Returns the validated frame plus the synthetic report dates; rows
+    that fail validation land in invalid_rows with their row number,
+    original values and the reasons.
+    """
+    raw = pd.read_csv(path, dtype=str, keep_default_na=False)
+
+    missing = [h for h in CSV_COLUMNS if h not in raw.columns]
+    if missing:
+        print(f"[WARN] CSV is missing expected columns: {missing}")
+        error = "Missing columns: " + ", ".join(missing)
+        invalid_rows.extend(
+            {"row_number": i + 2, "raw_row": row, "error": error}
+            for i, row in enumerate(raw.to_dict("records"))
+        )
+        return empty_record_frame(), []
+
+    frame = raw.rename(columns=CSV_COLUMNS)
+    frame["subscription_status"] = (
+        frame["subscription_status"].str.strip().str.lower()
+    )
+    # Empty optional titles become None, as in the row-by-row loader
+    frame["workflow_title"] = frame["workflow_title"].where(
+        frame["workflow_title"] != "", None
+    )
+
+    # Whole-column coercion: anything that is not a non-negative
+    # integer shows up as NaN / negative / fractional
+    coerced = {
+        name: pd.to_numeric(frame[name], errors="coerce") for name in INT_FIELDS
+    }
+    bad_numeric = {
+        name: (vals.isna() | (vals < 0) | (vals % 1 != 0)).to_numpy()
+        for name, vals in coerced.items()
+    }
+
+    invalid_mask = np.zeros(len(frame), dtype=bool)
+    for mask in bad_numeric.values():
+        invalid_mask |= mask
+
+    # Business validation: billed cannot exceed sent
+    billed_over_sent = (
+        coerced["notifications_billed"] > coerced["notifications_sent"]
+    ).to_numpy()
+    invalid_mask |= billed_over_sent
+
+    # Only the (rare) failing rows get per-row treatment
+    for pos in np.nonzero(invalid_mask)[0]:
+        problems = [
+            f"{name} must be a non-negative integer"
+            for name in INT_FIELDS
+            if bad_numeric[name][pos]
+        ]
+        if billed_over_sent[pos]:
+            problems.append(
+                "Notifications billed cannot exceed notifications sent"
+            )
+        invalid_rows.append(
+            {
+                "row_number": int(pos) + 2,  # header is row 1
+                "raw_row": raw.iloc[pos].to_dict(),
+                "error": "; ".join(problems),
+            }
+        )
+
+    keep = ~invalid_mask
+    valid = frame.loc[keep].copy()
+    for name in INT_FIELDS:
+        valid[name] = coerced[name].loc[keep].astype(np.int64)
+
+    # Synthetic report date: cycle through 1–10 Jan 2025 by CSV position
+    report_dates = [
+        date(2025, 1, (int(pos) % 10) + 1) for pos in np.nonzero(keep)[0]
+    ]
+    return valid, report_dates
+
+
+# Seed an empty column store and caches so the endpoints respond
+# sensibly even before the first load completes.
+build_columns(empty_record_frame(), [])
+compute_derived_columns()
+build_insight_table()
+build_record_indexes()
+build_aggregate_caches()
+build_response_caches()
+
+
+def load_data_in_background() -> None:
+    """Run the CSV load and release any requests waiting on it."""
+    try:
+        load_data_from_csv()
+    finally:
+        data_loaded.set()
+
+
+async def wait_for_data() -> None:
+    """
+    Wait until the initial background load (if one was started) has
+    finished. A no-op before startup, so the seeded empty store serves.
+    The wait runs in a worker thread to keep the event loop free.
+    """
+    if load_thread is not None and not data_loaded.is_set():
+        await asyncio.to_thread(data_loaded.wait)
+
+
 # ------------------------
 # Startup event
 # ------------------------
 @app.on_event("startup")
 def startup_event():
-    """Load CSV data into memory when the API starts."""
-    load_data_from_csv()
+    """Kick off the CSV load without blocking server startup."""
+    global load_thread
+    load_thread = threading.Thread(target=load_data_in_background, daemon=True)
+    load_thread.start()
 
 
 # ------------------------
 # Basic endpoints
 # ------------------------
 @app.get("/")
-def read_root():
+async def read_root():
     return {"message": "Dashboard Page"}
 
 
 @app.get("/health")
-def health():
-    """Lightweight health check for monitoring."""
+async def health():
+    """Lightweight health check for monitoring; never blocks on the load."""
+    uuids = columns.get("account_uuid")
     return {
         "status": "ok",
-        "records_loaded": len(raw_records),
+        "records_loaded": int(uuids.size) if uuids is not None else 0,
         "invalid_rows": len(invalid_rows),
     }
 
@@ -303,70 +669,35 @@ def health():
 # ------------------------
 # Raw data endpoints
 # ------------------------
-@app.get("/records/raw", response_model=List[AccountRecord])
-def get_raw_records():
+@app.get("/records/raw")
+async def get_raw_records():
     """Return all valid records loaded from the CSV."""
-    return raw_records
+    await wait_for_data()
+    return Response(content=raw_records_json, media_type="application/json")
 
 
 @app.get("/records/invalid")
-def get_invalid_records():
+async def get_invalid_records():
     """Return rows that failed validation, if any."""
-    return invalid_rows
+    await wait_for_data()
+    return Response(content=invalid_rows_json, media_type="application/json")
 
 
 # ------------------------
 # Summary endpoint
 # ------------------------
-@app.get("/summary", response_model=SummaryResponse)
-def get_summary():
-    """High-level metrics for leadership."""
-    total_accounts = len(insights)
-    active_accounts = sum(
-        1 for r in insights if r.subscription_status == "active"
-    )
-    inactive_accounts = sum(
-        1 for r in insights if r.subscription_status == "inactive"
-    )
-
-    total_notifications_billed = sum(r.notifications_billed for r in insights)
-    total_messages_processed = sum(r.messages_processed for r in insights)
-    avg_notifications_billed_per_active = (
-        total_notifications_billed / active_accounts if active_accounts > 0 else 0.0
-    )
-    avg_messages_per_account = (
-        total_messages_processed / total_accounts if total_accounts > 0 else 0.0
-    )
-    avg_health_score = (
-        sum(r.health_score for r in insights) / total_accounts
-        if total_accounts > 0
-        else 0.0
-    )
-
-    at_risk_accounts = sum(1 for r in insights if r.churn_risk == "at_risk")
-    churned_accounts = sum(1 for r in insights if r.churn_risk == "churned")
-
-    return SummaryResponse(
-        total_accounts=total_accounts,
-        active_accounts=active_accounts,
-        inactive_accounts=inactive_accounts,
-        total_notifications_billed=total_notifications_billed,
-        avg_notifications_billed_per_active=round(
-            avg_notifications_billed_per_active, 2
-        ),
-        total_messages_processed=total_messages_processed,
-        avg_messages_per_account=round(avg_messages_per_account, 2),
-        avg_health_score=round(avg_health_score, 2),
-        at_risk_accounts=at_risk_accounts,
-        churned_accounts=churned_accounts,
-    )
+@app.get("/summary")
+async def get_summary():
+    """High-level metrics for leadership, served from the load-time cache."""
+    await wait_for_data()
+    return summary_cache
 
 
 # ------------------------
 # Paginated & filterable records endpoint
 # ------------------------
-@app.get("/records", response_model=PaginatedRecordsResponse)
-def get_records(
+@app.get("/records")
+async def get_records(
     page: int = Query(1, ge=1),
     page_size: int = Query(10, ge=1, le=100),
     subscription_status: Optional[str] = Query(
@@ -380,26 +711,33 @@ def get_records(
     ),
 ):
     """Paginated records with simple filters for the frontend table."""
-    filtered = insights
+    await wait_for_data()
+
+    # Candidate row indices, kept in original (sorted) row order;
+    # each filter narrows the set via the load-time indexes
+    idx = np.arange(columns["account_uuid"].size, dtype=np.int64)
 
     if subscription_status in {"active", "inactive"}:
-        filtered = [
-            r for r in filtered if r.subscription_status == subscription_status
-        ]
+        idx = status_index.get(
+            subscription_status, np.array([], dtype=np.int64)
+        )
 
     if min_health is not None:
-        filtered = [r for r in filtered if r.health_score >= min_health]
+        sorted_scores = columns["health_score"][health_sorted_idx]
+        pos = np.searchsorted(sorted_scores, min_health, side="left")
+        idx = np.intersect1d(idx, health_sorted_idx[pos:], assume_unique=True)
 
     if search:
-        s = search.lower()
-        filtered = [r for r in filtered if s in r.account_label.lower()]
+        idx = np.intersect1d(
+            idx, search_label_rows(search.lower()), assume_unique=True
+        )
 
-    total_items = len(filtered)
+    total_items = int(idx.size)
     total_pages = (total_items + page_size - 1) // page_size if total_items else 1
 
     start = (page - 1) * page_size
     end = start + page_size
-    items = filtered[start:end]
+    items = materialize_page(idx[start:end])
 
     return PaginatedRecordsResponse(
         items=items,
@@ -413,40 +751,22 @@ def get_records(
 # ------------------------
 # Analytics endpoints
 # ------------------------
-@app.get("/analytics/health-by-status", response_model=List[HealthByStatusItem])
-def health_by_status():
+@app.get("/analytics/health-by-status")
+async def health_by_status():
     """Counts of accounts by churn_risk (healthy / at_risk / churned)."""
-    buckets: Dict[str, int] = {"healthy": 0, "at_risk": 0, "churned": 0}
-    for r in insights:
-        buckets[r.churn_risk] = buckets.get(r.churn_risk, 0) + 1
-
-    return [
-        HealthByStatusItem(status=status, account_count=count)
-        for status, count in buckets.items()
-    ]
+    await wait_for_data()
+    return health_by_status_cache
 
 
-@app.get(
-    "/analytics/revenue-by-status",
-    response_model=List[RevenueByStatusItem],
-)
-def revenue_by_status():
+@app.get("/analytics/revenue-by-status")
+async def revenue_by_status():
     """Total notifications billed by churn_risk category."""
-    totals: Dict[str, int] = {"healthy": 0, "at_risk": 0, "churned": 0}
-    for r in insights:
-        totals[r.churn_risk] = totals.get(r.churn_risk, 0) + r.notifications_billed
-
-    return [
-        RevenueByStatusItem(status=status, total_notifications_billed=total)
-        for status, total in totals.items()
-    ]
+    await wait_for_data()
+    return revenue_by_status_cache
 
 
-@app.get(
-    "/analytics/notifications-over-time",
-    response_model=List[NotificationsOverTimeItem],
-)
-def notifications_over_time(
+@app.get("/analytics/notifications-over-time")
+async def notifications_over_time(
     start_date: Optional[date] = Query(None),
     end_date: Optional[date] = Query(None),
 ):
@@ -454,25 +774,31 @@ def notifications_over_time(
     Time series of total notifications billed per report_date.
     If start_date / end_date not provided, uses min/max available dates.
     """
-    if not insights:
-        return []
+    await wait_for_data()
 
-    dates = [r.report_date for r in insights]
-    min_date = min(dates)
-    max_date = max(dates)
+    if notification_dates.size == 0:
+        return []
 
-    start = start_date or min_date
-    end = end_date or max_date
+    # The date array is sorted, so the requested range is a contiguous
+    # slice found with two binary searches
+    start = np.datetime64(start_date) if start_date else notification_dates[0]
+    end = np.datetime64(end_date) if end_date else notification_dates[-1]
+    lo = int(np.searchsorted(notification_dates, start, side="left"))
+    hi = int(np.searchsorted(notification_dates, end, side="right"))
 
-    bucket: Dict[date, int] = {}
+    return [
+        {"date": d, "total_notifications_billed": total}
+        for d, total in zip(
+            notification_dates_py[lo:hi], notification_totals[lo:hi].tolist()
+        )
+    ]
 
-    for r in insights:
-        if start <= r.report_date <= end:
-            bucket[r.report_date] = bucket.get(r.report_date, 0) + r.notifications_billed
 
-    sorted_items = sorted(bucket.items(), key=lambda x: x[0])
+# ------------------------
+# Entrypoint
+# ------------------------
+if __name__ == "__main__":
+    import uvicorn
 
-    return [
-        NotificationsOverTimeItem(date=d, total_notifications_billed=total)
-        for d, total in sorted_items
-    ]
+    # uvloop replaces the default asyncio event loop with a faster one
+    uvicorn.run("main:app", host="127.0.0.1", port=8000, loop="uvloop")
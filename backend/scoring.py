@@ -0,0 +1,105 @@
+"""
+Numeric scoring kernels for the Customer Insights API.
+
+This module is deliberately free of framework imports: the kernels take
+plain NumPy arrays in and hand arrays back, so the file is a
+self-contained compilation unit - it can be AOT-compiled with mypyc or
+Cython, or JIT-compiled with numba (used here when available), without
+dragging the web layer along. Keeping the kernels out of main.py also
+lets numba's on-disk cache survive edits to the API code.
+"""
+import numpy as np
+
+try:
+    from numba import njit, prange
+
+    HAVE_NUMBA = True
+except ImportError:  # pragma: no cover - NumPy fallback covers scoring
+    HAVE_NUMBA = False
+
+# Score bucket edges and lookup tables: digitize/searchsorted maps a
+# metric to its bucket index, and the score arrays map bucket -> points
+USAGE_EDGES = np.array([100_000, 1_000_000], dtype=np.int64)
+USAGE_SCORES = np.array([10, 25, 40], dtype=np.int64)  # 0–40
+AUTOMATION_EDGES = np.array([1, 4], dtype=np.int64)  # none | 1–3 | 4+
+AUTOMATION_SCORES = np.array([0, 10, 20], dtype=np.int64)  # 0–20
+FOOTPRINT_EDGES = np.array([10_000, 50_000], dtype=np.int64)
+FOOTPRINT_SCORES = np.array([5, 15, 20], dtype=np.int64)  # 0–20
+BILLING_EDGES = np.array([0.0, 90.0])  # zero | up to 90% | above 90%
+BILLING_SCORES = np.array([0, 10, 20], dtype=np.int64)  # 0–20
+
+
+def score_rows(
+    msgs: np.ndarray,
+    autos: np.ndarray,
+    records: np.ndarray,
+    billing_utilisation: np.ndarray,
+    inactive: np.ndarray,
+) -> tuple:
+    """
+    Bucketed health score and churn code (0=healthy, 1=at_risk,
+    2=churned) for all rows. Plain-NumPy fallback kernel: each metric
+    is bucketed with np.digitize and mapped through its lookup table,
+    with no data-dependent branching.
+    """
+    usage_score = USAGE_SCORES[np.digitize(msgs, USAGE_EDGES)]
+    automation_score = AUTOMATION_SCORES[np.digitize(autos, AUTOMATION_EDGES)]
+    footprint_score = FOOTPRINT_SCORES[np.digitize(records, FOOTPRINT_EDGES)]
+    # right=True keeps a utilisation of exactly 0 / 90 in the lower bucket
+    billing_score = BILLING_SCORES[
+        np.digitize(billing_utilisation, BILLING_EDGES, right=True)
+    ]
+
+    health_score = (
+        usage_score + automation_score + footprint_score + billing_score
+    )  # 0–100
+
+    # If subscription inactive, health is 0
+    health_score = np.where(inactive, 0, health_score)
+
+    # Churn risk bucket
+    churn_code = np.where(inactive, 2, np.where(health_score < 40, 1, 0))
+
+    return health_score.astype(np.int64), churn_code.astype(np.int8)
+
+
+if HAVE_NUMBA:
+
+    @njit(cache=True, parallel=True)
+    def score_rows(  # noqa: F811 - JIT kernel replaces the NumPy fallback
+        msgs, autos, records, billing_utilisation, inactive
+    ):
+        """
+        JIT-compiled variant of score_rows: one fused parallel loop
+        using the same edge/lookup tables as the NumPy kernel, so the
+        bucket boundaries live in one place.
+        """
+        n = msgs.shape[0]
+        health_score = np.empty(n, dtype=np.int64)
+        churn_code = np.empty(n, dtype=np.int8)
+        for i in prange(n):
+            score = (
+                USAGE_SCORES[np.searchsorted(USAGE_EDGES, msgs[i], side="right")]
+                + AUTOMATION_SCORES[
+                    np.searchsorted(AUTOMATION_EDGES, autos[i], side="right")
+                ]
+                + FOOTPRINT_SCORES[
+                    np.searchsorted(FOOTPRINT_EDGES, records[i], side="right")
+                ]
+                + BILLING_SCORES[
+                    np.searchsorted(
+                        BILLING_EDGES, billing_utilisation[i], side="left"
+                    )
+                ]
+            )
+
+            if inactive[i]:
+                health_score[i] = 0
+                churn_code[i] = 2
+            elif score < 40:
+                health_score[i] = score
+                churn_code[i] = 1
+            else:
+                health_score[i] = score
+                churn_code[i] = 0
+        return health_score, churn_code
@@ -14,3 +14,18 @@ def test_summary_endpoint():
     assert response.status_code == 200
     data = response.json()
     assert "total_accounts" in data
+
+
+def test_records_filters():
+    # Entering the client context runs startup, so the CSV is loaded
+    with TestClient(app) as loaded_client:
+        response = loaded_client.get(
+            "/records",
+            params={"subscription_status": "active", "min_health": 40},
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total_items"] > 0
+        for item in data["items"]:
+            assert item["subscription_status"] == "active"
+            assert item["health_score"] >= 40